@@ -21,18 +21,21 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 CURLY_TO_REGEX = re.compile(
     r'(?:^|(?<=[^{])|(?<={{)){(?P<name>[^{][0-9a-zA-z_]*?)(?:\:(?P<quantity>\d*)(?P<type>[sd])?)?}',
 )
 
 
+@lru_cache(maxsize=128)
 def curly_to_regex(s: str) -> re.Pattern:
     """Return regex pattern converted from provided python formatting style pattern.
 
     By default all parameters are strings, if you want to specify number you can do: {num:d}
     If you want to specify parameter's length you can do: {two_symbols:2} or {four_digits:4d}
     Characters { and } can be escaped the same way as in python: {{ and }}
+    Compiled patterns are cached, so repeated calls with the same pattern are cheap.
     For example:
                 r'{subject_id:d}_{session_name}.csv'
     converts to r'(?P<subject_id>[0-9]+)_(?P<session_name>.+).csv'
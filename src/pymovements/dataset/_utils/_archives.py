@@ -123,32 +123,73 @@ def extract_archive(
             Path(children[0]).rmdir()
 
     if recursive:
-        # Get filepaths of all archives in extracted directory.
-        archive_extensions = [
-            *_ARCHIVE_EXTRACTORS.keys(),
-            *_ARCHIVE_TYPE_ALIASES.keys(),
-            *_COMPRESSED_FILE_OPENERS.keys(),
-        ]
-        archive_filepaths = get_filepaths(path=destination_path, extension=archive_extensions)
-        archive_filepaths = [filepath for filepath in archive_filepaths if filepath != source_path]
-
-        # Extract all found archives.
-        for archive_filepath in archive_filepaths:
-            extract_destination = archive_filepath.parent / archive_filepath.stem
-
-            extract_archive(
-                source_path=archive_filepath,
-                destination_path=extract_destination,
-                recursive=recursive,
-                remove_finished=remove_finished,
-                remove_top_level=remove_top_level,
-                verbose=0 if verbose < 2 else 2,
-                resume=resume,
-            )
+        extract_nested_archives(
+            destination_path,
+            exclude=[source_path],
+            remove_finished=remove_finished,
+            remove_top_level=remove_top_level,
+            resume=resume,
+            verbose=verbose,
+        )
 
     return destination_path
 
 
+def extract_nested_archives(
+        path: Path,
+        *,
+        exclude: list[Path] | None = None,
+        remove_finished: bool = False,
+        remove_top_level: bool = True,
+        resume: bool = True,
+        verbose: int = 1,
+) -> None:
+    """Recursively extract all archives found in a directory.
+
+    Parameters
+    ----------
+    path: Path
+        Path to the directory which is searched for archives.
+    exclude: list[Path] | None
+        Archive paths which are not extracted. (default: None)
+    remove_finished: bool
+        If ``True``, remove the archives after the extraction. (default: False)
+    remove_top_level: bool
+        If ``True``, remove the top-level directory if it has only one child. (default: True)
+    resume: bool
+        Resume previous extraction by skipping existing files.
+        Checks for correct size of existing files but not integrity. (default: True)
+    verbose: int
+        Verbosity levels: (1) Print no messages for the extracted archives. (2) Print messages for
+        each extracted archive. (default: 1)
+    """
+    if exclude is None:
+        exclude = []
+
+    # Get filepaths of all archives in extracted directory.
+    archive_extensions = [
+        *_ARCHIVE_EXTRACTORS.keys(),
+        *_ARCHIVE_TYPE_ALIASES.keys(),
+        *_COMPRESSED_FILE_OPENERS.keys(),
+    ]
+    archive_filepaths = get_filepaths(path=path, extension=archive_extensions)
+    archive_filepaths = [filepath for filepath in archive_filepaths if filepath not in exclude]
+
+    # Extract all found archives.
+    for archive_filepath in archive_filepaths:
+        extract_destination = archive_filepath.parent / archive_filepath.stem
+
+        extract_archive(
+            source_path=archive_filepath,
+            destination_path=extract_destination,
+            recursive=True,
+            remove_finished=remove_finished,
+            remove_top_level=remove_top_level,
+            verbose=0 if verbose < 2 else 2,
+            resume=resume,
+        )
+
+
 def _extract_tar(
         source_path: Path,
         destination_path: Path,
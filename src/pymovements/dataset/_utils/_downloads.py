@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 import hashlib
+import sys
 import urllib.request
 from pathlib import Path
 from typing import Any
@@ -239,7 +240,8 @@ def _calculate_md5(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
     filepath : Path
         Path to file.
     chunk_size : int
-        Byte size of processed chunks. (default: 1024 * 1024)
+        Byte size of processed chunks. Only used for Python versions before 3.11.
+        (default: 1024 * 1024)
 
     Returns
     -------
@@ -249,9 +251,13 @@ def _calculate_md5(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
     # Setting the `usedforsecurity` flag does not change anything about the functionality, but
     # indicates that we are not using the MD5 checksum for cryptography.
     # This enables its usage in restricted environments like FIPS without raising an error.
-    file_md5 = hashlib.new('md5', usedforsecurity=False)
-
     with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(chunk_size), b''):
-            file_md5.update(chunk)
+        if sys.version_info < (3, 11):  # pragma: <3.11 cover
+            file_md5 = hashlib.new('md5', usedforsecurity=False)
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                file_md5.update(chunk)
+        else:  # pragma: >=3.11 cover
+            # file_digest() reads into a reusable buffer without allocating a bytes object per
+            # chunk and releases the GIL while hashing.
+            file_md5 = hashlib.file_digest(f, lambda: hashlib.new('md5', usedforsecurity=False))
     return file_md5.hexdigest()
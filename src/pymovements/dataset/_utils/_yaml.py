@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import builtins
 import importlib
+import sys
 from typing import Any
 
 import yaml
@@ -125,3 +126,14 @@ def reverse_substitute_types(data: Any) -> Any:
             return getattr(module, class_name)
         return getattr(builtins, type_name)
     return data
+
+
+def intern_strings(data: Any) -> Any:
+    """Intern all strings in data, including dictionary keys."""
+    if isinstance(data, dict):
+        return {intern_strings(k): intern_strings(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [intern_strings(v) for v in data]
+    if isinstance(data, str):
+        return sys.intern(data)
+    return data
@@ -20,9 +20,13 @@
 """DatasetDefinition module."""
 from __future__ import annotations
 
-from dataclasses import asdict
+import os
+import sys
+from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from warnings import warn
@@ -31,17 +35,69 @@ import yaml
 
 from pymovements._utils._html import repr_html
 from pymovements.dataset._utils._resources import _HasResourcesIndexer
+from pymovements.dataset._utils._yaml import intern_strings
 from pymovements.dataset._utils._yaml import reverse_substitute_types
 from pymovements.dataset._utils._yaml import substitute_types
 from pymovements.dataset._utils._yaml import type_constructor
 from pymovements.gaze.experiment import Experiment
 
 
-yaml.add_multi_constructor('!', type_constructor, Loader=yaml.SafeLoader)
+# Use the libyaml-backed C loader and dumper if available, as they are considerably faster.
+try:
+    from yaml import CSafeLoader as _BaseSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _BaseSafeLoader  # type: ignore[assignment]
+_SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+
+class _SafeLoader(_BaseSafeLoader):  # pylint: disable=too-many-ancestors
+    """Safe YAML loader which resolves ``!``-prefixed tags to Python types.
+
+    The tag constructor is registered on this subclass only, so that the global
+    :py:class:`yaml.SafeLoader` is left untouched.
+    """
+
+
+_SafeLoader.add_multi_constructor('!', type_constructor)
+
+
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+
+
+def _resolve_scalar_tag(event: yaml.ScalarEvent) -> str:
+    """Return the tag an untagged scalar event is resolved to by the safe loader."""
+    return yaml.resolver.Resolver().resolve(yaml.ScalarNode, event.value, event.implicit)
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML file and cache the result.
+
+    The modification time and the file size are only part of the signature to invalidate the
+    cache entry on changes of the file. Callers must not mutate the returned dictionary.
+    """
+    # pylint: disable=unused-argument
+    # Parsing a single buffer avoids reading the file in small chunks through Python file objects.
+    data = yaml.load(Path(path).read_bytes(), Loader=_SafeLoader)
+
+    # Resource tables can be large and repeat the same keys, mirrors and filename parts.
+    for key in ('mirrors', 'resources'):
+        if isinstance(data, dict) and key in data:
+            data[key] = intern_strings(data[key])
+    return data
+
+
+def _clear_from_yaml_cache() -> None:
+    """Clear the cache of parsed YAML files used by :py:meth:`DatasetDefinition.from_yaml`."""
+    _load_yaml_cached.cache_clear()
+
+
+# Slots remove the per-instance __dict__ and speed up attribute access. Requires Python 3.10+.
+_DATACLASS_KWARGS: dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 @repr_html()
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class DatasetDefinition:
     """Definition to initialize a :py:class:`~pymovements.dataset.Dataset`.
 
@@ -182,7 +238,7 @@ class DatasetDefinition:
     distance_column: str | None = None
 
     _has_resources: _HasResourcesIndexer = field(
-        default_factory=_HasResourcesIndexer, init=False, repr=False, compare=False, hash=False,
+        default_factory=_HasResourcesIndexer, init=False, repr=False, compare=False,
     )
 
     @staticmethod
@@ -199,8 +255,9 @@ class DatasetDefinition:
         DatasetDefinition
             Initialized dataset definition
         """
-        with open(path, encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        resolved_path = os.path.realpath(path)
+        stat = os.stat(resolved_path)
+        data = deepcopy(_load_yaml_cached(resolved_path, stat.st_mtime_ns, stat.st_size))
 
         # Convert experiment dict to Experiment object if present
         if 'experiment' in data:
@@ -210,6 +267,55 @@ class DatasetDefinition:
         # Initialize DatasetDefinition with YAML data
         return DatasetDefinition(**data)
 
+    @staticmethod
+    def peek_name(path: str | Path) -> str | None:
+        """Read the dataset name from a YAML file without loading the whole definition.
+
+        The YAML file is parsed as a stream of events, which stops as soon as the top-level
+        ``name`` entry is found. Nested values are skipped without being constructed.
+
+        Parameters
+        ----------
+        path: str | Path
+            Path to the YAML definition file
+
+        Returns
+        -------
+        str | None
+            The name of the dataset definition or ``None`` if the file has no top-level ``name``
+            or if the name cannot be determined without loading the whole definition, e.g. if it
+            is an alias or not a plain string.
+        """
+        with open(path, encoding='utf-8') as f:
+            depth = 0
+            is_key = False
+            is_name_value = False
+            for event in yaml.parse(f, Loader=_SafeLoader):
+                if isinstance(event, yaml.AliasEvent) and depth == 1:
+                    return None
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    depth += 1
+                    if depth == 1:
+                        if isinstance(event, yaml.SequenceStartEvent):
+                            return None
+                        is_key = True
+                    elif depth == 2 and is_name_value:
+                        return None
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+                    if depth == 1:
+                        is_key = True
+                    elif depth == 0:
+                        return None
+                elif isinstance(event, yaml.ScalarEvent) and depth == 1:
+                    if is_name_value:
+                        if event.tag is not None or _resolve_scalar_tag(event) != _YAML_STR_TAG:
+                            return None
+                        return event.value
+                    is_name_value = is_key and event.value == 'name'
+                    is_key = not is_key
+        return None
+
     def to_dict(
         self,
         *,
@@ -232,19 +338,23 @@ class DatasetDefinition:
         dict[str, Any]
             Dictionary representation of dataset definition.
         """
-        data = asdict(self)
+        # Avoid dataclasses.asdict() as it deep-copies all values recursively.
+        data = {}
+        for definition_field in fields(self):
+            key = definition_field.name
+            value = getattr(self, key)
 
-        # Delete private fields from dictionary.
-        if exclude_private:
-            for key in list(data.keys()):
-                if key.startswith('_'):
-                    del data[key]
+            # Skip private fields.
+            if exclude_private and key.startswith('_'):
+                continue
 
-        # Delete fields that evaluate to False (False, None, [], {})
-        if exclude_none:
-            for key, value in list(data.items()):
-                if not isinstance(value, (bool, int, float)) and not value:
-                    del data[key]
+            # Skip fields that evaluate to False (False, None, [], {})
+            if exclude_none and not isinstance(value, (bool, int, float)) and not value:
+                continue
+
+            if isinstance(value, (dict, list)):
+                value = value.copy()
+            data[key] = value
 
         if 'experiment' in data and data['experiment'] is not None:
             data['experiment'] = data['experiment'].to_dict(exclude_none=exclude_none)
@@ -275,7 +385,7 @@ class DatasetDefinition:
         data = substitute_types(data)
 
         with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, sort_keys=False)
+            yaml.dump(data, f, Dumper=_SafeDumper, sort_keys=False)
 
     @property
     def has_resources(self) -> _HasResourcesIndexer:
@@ -316,7 +426,21 @@ class DatasetDefinition:
         return self._has_resources
 
     def __post_init__(self) -> None:
-        """Handle special attributes."""
+        """Handle special attributes.
+
+        Raises
+        ------
+        ValueError
+            If a mirror does not end with a '/'.
+        """
+        if isinstance(self.mirrors, dict):
+            for content, mirrors in self.mirrors.items():
+                for mirror in mirrors or ():
+                    if not mirror.endswith('/'):
+                        raise ValueError(
+                            f"{content} mirror must end with a '/' (mirror = {mirror})",
+                        )
+
         if self.extract is not None:
             warn(
                 DeprecationWarning(
@@ -20,17 +20,36 @@
 """Provides private functions for downloading and extracting datasets."""
 from __future__ import annotations
 
+import json
+import os
 import shutil
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
 from urllib.error import URLError
 from warnings import warn
 
 from pymovements.dataset._utils._archives import extract_archive
+from pymovements.dataset._utils._archives import extract_nested_archives
 from pymovements.dataset._utils._downloads import download_file
 from pymovements.dataset.dataset_definition import DatasetDefinition
 from pymovements.dataset.dataset_paths import DatasetPaths
 from pymovements.exceptions import UnknownFileType
 
+# Maximum number of resources that are downloaded concurrently.
+_MAX_DOWNLOAD_WORKERS = 8
+
+# Name of the file in each destination directory which lists the extracted resources.
+_EXTRACTED_MANIFEST_FILENAME = '.pymovements_extracted.json'
+
+_CONTENT_DIRNAMES = {
+    'gaze': 'raw',
+    'precomputed_events': 'precomputed_events',
+    'precomputed_reading_measures': 'precomputed_reading_measures',
+}
+
 
 def download_dataset(
         definition: DatasetDefinition,
@@ -54,6 +73,10 @@ def download_dataset(
     If the existing file does not match the expected checksum it is overwritten with the
     downloaded new file.
 
+    Extracted resources are recorded in the extraction directories. If ``extract=True``,
+    resources which have already been extracted with the same checksum are neither downloaded
+    nor extracted again.
+
     Parameters
     ----------
     definition: DatasetDefinition
@@ -81,33 +104,85 @@ def download_dataset(
     if not definition.resources:
         raise AttributeError('resources must be specified to download dataset.')
 
-    for content in ('gaze', 'precomputed_events', 'precomputed_reading_measures'):
-        if definition.has_files[content]:
-            if not definition.mirrors:
-                mirrors = None
-            else:
-                mirrors = definition.mirrors.get(content, None)
+    pending_filenames = {}
+
+    # Archives are extracted in the background as soon as their download finished. Each
+    # destination directory gets its own single-threaded executor, as concurrent extractions into
+    # the same directory race on creating the same subdirectories.
+    with ExitStack() as stack:
+        extract_futures: list[Future[None]] = []
+
+        for content, content_directory in _CONTENT_DIRNAMES.items():
+            if definition.has_files[content]:
+                if not definition.mirrors:
+                    mirrors = None
+                else:
+                    mirrors = definition.mirrors.get(content, None)
+
+                if not definition.resources[content]:
+                    raise AttributeError(
+                        f"'{content}' resources must be specified to download dataset.",
+                    )
+
+                resources = definition.resources[content]
+                on_downloaded: Callable[[dict[str, str]], None] | None = None
+
+                if extract:
+                    destination_dirpath = getattr(paths, content_directory)
+                    destination_dirpath.mkdir(parents=True, exist_ok=True)
+
+                    # Skip resources that have already been downloaded and extracted.
+                    extracted = _read_extracted_manifest(destination_dirpath)
+                    resources = [
+                        resource for resource in resources
+                        if resource['filename'] not in extracted
+                        or extracted[resource['filename']] != resource['md5']
+                    ]
+                    if verbose and not resources:
+                        print(
+                            f'Using already extracted {content} resources in '
+                            f'{destination_dirpath}',
+                        )
+
+                    on_downloaded = _make_extract_callback(
+                        executor=stack.enter_context(ThreadPoolExecutor(max_workers=1)),
+                        futures=extract_futures,
+                        source_dirpath=paths.downloads,
+                        destination_dirpath=destination_dirpath,
+                        # A single archive can be extracted recursively right away, as no other
+                        # archive is extracted into the same directory.
+                        recursive=len(resources) == 1,
+                        remove_finished=remove_finished,
+                        remove_top_level=True,
+                        resume=resume,
+                        verbose=verbose,
+                    )
 
-            if not definition.resources[content]:
-                raise AttributeError(
-                    f"'{content}' resources must be specified to download dataset.",
+                _download_resources(
+                    mirrors=mirrors,
+                    resources=resources,
+                    target_dirpath=paths.downloads,
+                    verbose=verbose,
+                    on_downloaded=on_downloaded,
                 )
+                pending_filenames[content] = [resource['filename'] for resource in resources]
 
-            _download_resources(
-                mirrors=mirrors,
-                resources=definition.resources[content],
-                target_dirpath=paths.downloads,
-                verbose=verbose,
-            )
+        for future in extract_futures:
+            future.result()
 
     if extract:
-        extract_dataset(
-            definition=definition,
-            paths=paths,
-            remove_finished=remove_finished,
-            resume=resume,
-            verbose=verbose,
-        )
+        for content, filenames in pending_filenames.items():
+            destination_dirpath = getattr(paths, _CONTENT_DIRNAMES[content])
+            if len(filenames) > 1:
+                extract_nested_archives(
+                    destination_dirpath,
+                    exclude=[paths.downloads / filename for filename in filenames],
+                    remove_finished=remove_finished,
+                    remove_top_level=True,
+                    resume=resume,
+                    verbose=verbose,
+                )
+            _record_extracted(definition, content, destination_dirpath, filenames)
 
 
 def extract_dataset(
@@ -139,31 +214,177 @@ def extract_dataset(
         messages for recursive archives. (2) Print messages for extracting each dataset resource and
         each recursive archive extract. (default: 1)
     """
-    content_dirnames = {
-        'gaze': 'raw',
-        'precomputed_events': 'precomputed_events',
-        'precomputed_reading_measures': 'precomputed_reading_measures',
-    }
-
-    for content, content_directory in content_dirnames.items():
-        if definition.has_files[content]:
-            destination_dirpath = getattr(paths, content_directory)
-            destination_dirpath.mkdir(parents=True, exist_ok=True)
-            for resource in definition.resources[content]:
-                source_path = paths.downloads / resource['filename']
-
-                try:
-                    extract_archive(
-                        source_path=source_path,
-                        destination_path=destination_dirpath,
-                        recursive=True,
-                        remove_finished=remove_finished,
-                        remove_top_level=remove_top_level,
-                        resume=resume,
-                        verbose=verbose,
-                    )
-                except UnknownFileType:  # just copy file to target if not an archive.
-                    shutil.copy(source_path, destination_dirpath / resource['filename'])
+    contents = [content for content in _CONTENT_DIRNAMES if definition.has_files[content]]
+    if not contents:
+        return
+
+    # Content types are extracted concurrently, as each has its own destination directory.
+    # Archives sharing a destination directory are extracted one after another, as concurrent
+    # extractions race on creating the same subdirectories.
+    max_workers = min(os.cpu_count() or 1, len(contents))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _extract_content,
+                definition=definition,
+                paths=paths,
+                content=content,
+                filenames=[resource['filename'] for resource in definition.resources[content]],
+                remove_finished=remove_finished,
+                remove_top_level=remove_top_level,
+                resume=resume,
+                verbose=verbose,
+            )
+            for content in contents
+        ]
+        for future in futures:
+            future.result()
+
+
+def _extract_content(
+        definition: DatasetDefinition,
+        paths: DatasetPaths,
+        content: str,
+        filenames: list[str],
+        *,
+        remove_finished: bool,
+        remove_top_level: bool,
+        resume: bool,
+        verbose: int,
+) -> None:
+    """Extract resources of a single content type and record them as extracted."""
+    destination_dirpath = getattr(paths, _CONTENT_DIRNAMES[content])
+    destination_dirpath.mkdir(parents=True, exist_ok=True)
+
+    for filename in filenames:
+        _extract_resource(
+            source_dirpath=paths.downloads,
+            filename=filename,
+            destination_dirpath=destination_dirpath,
+            recursive=len(filenames) == 1,
+            remove_finished=remove_finished,
+            remove_top_level=remove_top_level,
+            resume=resume,
+            verbose=verbose,
+        )
+
+    if len(filenames) > 1:
+        # Nested archives are extracted afterwards in a single pass, as they can be located
+        # anywhere in the shared destination directory.
+        extract_nested_archives(
+            destination_dirpath,
+            exclude=[paths.downloads / filename for filename in filenames],
+            remove_finished=remove_finished,
+            remove_top_level=remove_top_level,
+            resume=resume,
+            verbose=verbose,
+        )
+
+    _record_extracted(definition, content, destination_dirpath, filenames)
+
+
+def _make_extract_callback(
+        executor: ThreadPoolExecutor,
+        futures: list[Future[None]],
+        source_dirpath: Path,
+        destination_dirpath: Path,
+        *,
+        recursive: bool,
+        remove_finished: bool,
+        remove_top_level: bool,
+        resume: bool,
+        verbose: int,
+) -> Callable[[dict[str, str]], None]:
+    """Create callback which submits the extraction of a downloaded resource to the executor."""
+    def on_downloaded(resource: dict[str, str]) -> None:
+        futures.append(
+            executor.submit(
+                _extract_resource,
+                source_dirpath=source_dirpath,
+                filename=resource['filename'],
+                destination_dirpath=destination_dirpath,
+                recursive=recursive,
+                remove_finished=remove_finished,
+                remove_top_level=remove_top_level,
+                resume=resume,
+                verbose=verbose,
+            ),
+        )
+    return on_downloaded
+
+
+def _record_extracted(
+        definition: DatasetDefinition,
+        content: str,
+        destination_dirpath: Path,
+        filenames: list[str],
+) -> None:
+    """Record resources of a content type as extracted into the destination directory."""
+    if not filenames:
+        return
+
+    md5s = {resource['filename']: resource['md5'] for resource in definition.resources[content]}
+    extracted = _read_extracted_manifest(destination_dirpath)
+    extracted.update({filename: md5s[filename] for filename in filenames})
+    _write_extracted_manifest(destination_dirpath, extracted)
+
+
+def _read_extracted_manifest(dirpath: Path) -> dict[str, str | None]:
+    """Read filenames and checksums of resources extracted into directory.
+
+    An unreadable manifest is treated as empty, so that all resources are extracted again.
+    """
+    manifest_path = dirpath / _EXTRACTED_MANIFEST_FILENAME
+    if not manifest_path.is_file():
+        return {}
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            extracted = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(extracted, dict):
+        return {}
+    return extracted
+
+
+def _write_extracted_manifest(dirpath: Path, extracted: dict[str, str | None]) -> None:
+    """Write filenames and checksums of resources extracted into directory.
+
+    The manifest is written to a temporary file first, so that an interrupted write does not
+    leave a truncated manifest behind.
+    """
+    manifest_path = dirpath / _EXTRACTED_MANIFEST_FILENAME
+    tmp_path = manifest_path.with_name(f'{manifest_path.name}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(extracted, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def _extract_resource(
+        source_dirpath: Path,
+        filename: str,
+        destination_dirpath: Path,
+        *,
+        recursive: bool,
+        remove_finished: bool,
+        remove_top_level: bool,
+        resume: bool,
+        verbose: int,
+) -> None:
+    """Extract resource archive or copy resource file if it is not an archive."""
+    source_path = source_dirpath / filename
+    try:
+        extract_archive(
+            source_path=source_path,
+            destination_path=destination_dirpath,
+            recursive=recursive,
+            remove_finished=remove_finished,
+            remove_top_level=remove_top_level,
+            resume=resume,
+            verbose=verbose,
+        )
+    except UnknownFileType:  # just copy file to target if not an archive.
+        shutil.copy(source_path, destination_dirpath / filename)
 
 
 def _download_resources(
@@ -171,14 +392,59 @@ def _download_resources(
         resources: list[dict[str, str]] | tuple[dict[str, str], ...],
         target_dirpath: Path,
         verbose: bool,
+        on_downloaded: Callable[[dict[str, str]], None] | None = None,
 ) -> None:
-    """Download resources."""
-    for resource in resources:
-        if not mirrors:
-            _download_resource_without_mirrors(resource, target_dirpath, verbose)
-        else:
-            assert mirrors is not None
-            _download_resource_with_mirrors(mirrors, resource, target_dirpath, verbose)
+    """Download resources.
+
+    Multiple resources are downloaded concurrently in a thread pool, as downloading is bound by
+    network I/O. If downloading fails for more than one resource, a single ``RuntimeError`` listing
+    all failed resources is raised. If ``on_downloaded`` is given, it is called with each resource
+    right after it has been downloaded successfully.
+    """
+    if len(resources) <= 1:
+        for resource in resources:
+            _download_resource(mirrors, resource, target_dirpath, verbose, on_downloaded)
+        return
+
+    errors: list[RuntimeError] = []
+    max_workers = min(_MAX_DOWNLOAD_WORKERS, len(resources))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _download_resource, mirrors, resource, target_dirpath, verbose, on_downloaded,
+            )
+            for resource in resources
+        ]
+        for future in futures:
+            try:
+                future.result()
+            except RuntimeError as error:
+                errors.append(error)
+
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        error_messages = '\n'.join(str(error) for error in errors)
+        raise RuntimeError(
+            f'downloading {len(errors)} resources failed:\n{error_messages}',
+        ) from errors[0]
+
+
+def _download_resource(
+        mirrors: list[str] | tuple[str, ...] | None,
+        resource: dict[str, str],
+        target_dirpath: Path,
+        verbose: bool,
+        on_downloaded: Callable[[dict[str, str]], None] | None = None,
+) -> None:
+    """Download resource with or without mirrors."""
+    if not mirrors:
+        _download_resource_without_mirrors(resource, target_dirpath, verbose)
+    else:
+        _download_resource_with_mirrors(mirrors, resource, target_dirpath, verbose)
+
+    if on_downloaded is not None:
+        on_downloaded(resource)
 
 
 def _download_resource_without_mirrors(
@@ -212,16 +478,20 @@ def _download_resource_with_mirrors(
     """Download resource with mirrors."""
     success = False
 
+    resource_path = resource['resource']
+    filename = resource['filename']
+    md5 = resource['md5']
+
     for mirror_idx, mirror in enumerate(mirrors):
 
-        url = f'{mirror}{resource["resource"]}'
+        url = mirror + resource_path
 
         try:
             download_file(
                 url=url,
                 dirpath=target_dirpath,
-                filename=resource['filename'],
-                md5=resource['md5'],
+                filename=filename,
+                md5=md5,
                 verbose=verbose,
             )
             success = True
@@ -241,6 +511,4 @@ def _download_resource_with_mirrors(
         break
 
     if not success:
-        raise RuntimeError(
-            f"downloading resource {resource['resource']} failed for all mirrors.",
-        )
+        raise RuntimeError(f'downloading resource {resource_path} failed for all mirrors.')
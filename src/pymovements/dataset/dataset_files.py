@@ -20,7 +20,9 @@
 """Functionality to scan, load and save dataset files."""
 from __future__ import annotations
 
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
@@ -242,10 +244,7 @@ def load_gaze_files(
     RuntimeError
         If file type of gaze file is not supported.
     """
-    gaze_dfs: list[GazeDataFrame] = []
-
-    # Read gaze files from fileinfo attribute.
-    for fileinfo_row in tqdm(fileinfo.to_dicts()):
+    def _load_gaze_file(fileinfo_row: dict[str, Any]) -> GazeDataFrame:
         filepath = Path(fileinfo_row['filepath'])
         filepath = paths.raw / filepath
 
@@ -255,13 +254,22 @@ def load_gaze_files(
                 extension=extension,
             )
 
-        gaze_df = load_gaze_file(
+        return load_gaze_file(
             filepath=filepath,
             fileinfo_row=fileinfo_row,
             definition=deepcopy(definition),
             preprocessed=preprocessed,
         )
-        gaze_dfs.append(gaze_df)
+
+    # Read gaze files from fileinfo attribute.
+    # Polars releases the GIL while reading, so files are read concurrently in threads.
+    # The order of the returned dataframes matches the order of the fileinfo rows.
+    fileinfo_rows = fileinfo.to_dicts()
+    max_workers = max(min(os.cpu_count() or 1, len(fileinfo_rows)), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        gaze_dfs = list(
+            tqdm(executor.map(_load_gaze_file, fileinfo_rows), total=len(fileinfo_rows)),
+        )
 
     return gaze_dfs
 
@@ -20,6 +20,8 @@
 """DatasetLibrary module."""
 from __future__ import annotations
 
+from collections.abc import Iterator
+from collections.abc import MutableMapping
 from copy import deepcopy
 from importlib import resources
 from pathlib import Path
@@ -31,17 +33,58 @@ from pymovements import datasets
 from pymovements.dataset.dataset_definition import DatasetDefinition
 
 
+class _LazyDefinitionDict(MutableMapping[str, DatasetDefinition]):
+    """Dictionary of dataset definitions which loads YAML definitions on first access.
+
+    Definitions added via :py:meth:`add_file` are listed under their name right away, but the
+    file is only parsed when the definition itself is accessed.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, DatasetDefinition | Path] = {}
+
+    def add_file(self, name: str, path: Path) -> None:
+        """Add a YAML definition file which is loaded on first access."""
+        self._entries[name] = path
+
+    def __getitem__(self, name: str) -> DatasetDefinition:
+        entry = self._entries[name]
+        if isinstance(entry, Path):
+            entry = DatasetDefinition.from_yaml(entry)
+            self._entries[name] = entry
+        return entry
+
+    def __setitem__(self, name: str, definition: DatasetDefinition) -> None:
+        self._entries[name] = definition
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class DatasetLibrary:
     """Provides access by name to :py:class:`~pymovements.dataset.DatasetDefinition`.
 
     Attributes
     ----------
-    definitions: dict[str, DatasetDefinition]
+    definitions: MutableMapping[str, DatasetDefinition]
         Dictionary of :py:class:`~pymovements.dataset.DatasetDefinition`,
-        either as classes or instances.
+        either as classes or instances. Definitions added from YAML files are listed right away,
+        but only loaded on their first access.
     """
 
-    definitions: dict[str, DatasetDefinition] = {}
+    definitions: _LazyDefinitionDict = _LazyDefinitionDict()
 
     @classmethod
     def add(cls, definition: type[DatasetDefinition] | Path | str) -> None:
@@ -61,9 +104,13 @@ class DatasetLibrary:
             * A string path to a YAML file
         """
         if isinstance(definition, (str, Path)):
-            # Load from YAML file
-            yaml_def = DatasetDefinition.from_yaml(definition)
-            cls.definitions[yaml_def.name] = yaml_def
+            # Only read the name of the definition. The file is fully loaded on first access.
+            name = DatasetDefinition.peek_name(definition)
+            if name is None:
+                yaml_def = DatasetDefinition.from_yaml(definition)
+                cls.definitions[yaml_def.name] = yaml_def
+            else:
+                cls.definitions.add_file(name, Path(definition))
         else:
             cls.definitions[definition.name] = definition()
 
@@ -163,7 +163,7 @@ class GazeBase(DatasetDefinition):
                 (
                     r'S_{round_id:1d}{subject_id:d}'
                     r'_S{session_id:d}'
-                    r'_{task_name}.csv'
+                    r'_{task_name}\.csv$'
                 ),
         },
     )
@@ -192,6 +192,8 @@ class GazeBase(DatasetDefinition):
         default_factory=lambda: {
             'gaze': {
                 'null_values': 'NaN',
+                # all columns have a dtype override, so no schema inference is needed.
+                'infer_schema_length': 0,
                 'schema_overrides': {
                     'n': pl.Int64,
                     'x': pl.Float32,
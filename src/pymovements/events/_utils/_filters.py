@@ -46,20 +46,19 @@ def filter_candidates_remove_nans(
     list[np.ndarray]
         Returns a filtered list of candidates.
     """
-    values = np.array(values)
+    # Compute the nan mask once for all samples instead of once per candidate sample.
+    is_nan = np.isnan(np.array(values)).any(axis=1)
     return_candidates = []
     for candidate in candidates:
         if len(candidate) == 0:
             continue
-        cand_values = values[np.array(candidate)]
-        start_id = 0
-        while np.sum(np.isnan(cand_values[start_id, :])) > 0:
-            start_id += 1
-        end_id = len(cand_values) - 1
-        while np.sum(np.isnan(cand_values[end_id, :])) > 0:
-            end_id -= 1
-        cur_candidate = list(candidate[start_id:end_id + 1])
-        return_candidates.append(np.array(cur_candidate))
+        candidate = np.array(candidate)
+        non_nan_ids = np.flatnonzero(~is_nan[candidate])
+        if len(non_nan_ids) == 0:
+            # Candidates consisting only of nans are empty after removing them.
+            return_candidates.append(candidate[:0])
+            continue
+        return_candidates.append(candidate[non_nan_ids[0]:non_nan_ids[-1] + 1])
     return return_candidates
 
 
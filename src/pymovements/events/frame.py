@@ -25,7 +25,6 @@ from typing import Any
 
 import numpy as np
 import polars as pl
-from tqdm import tqdm
 
 from pymovements._utils import _checks
 from pymovements._utils._html import repr_html
@@ -338,11 +337,7 @@ class EventDataFrame:
             Text dataframe to map fixation to.
         """
         self.unnest()
-        aois = [
-            aoi_dataframe.get_aoi(row=row, x_eye='location_x', y_eye='location_y')
-            for row in tqdm(self.frame.iter_rows(named=True))
-        ]
-        aoi_df = pl.concat(aois)
+        aoi_df = aoi_dataframe.get_aois(self.frame, x_eye='location_x', y_eye='location_y')
         self.frame = pl.concat([self.frame, aoi_df], how='horizontal')
 
     def __str__(self: Any) -> str:
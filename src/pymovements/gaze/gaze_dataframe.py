@@ -29,7 +29,6 @@ from typing import Any
 
 import numpy as np
 import polars as pl
-from tqdm import tqdm
 
 import pymovements as pm  # pylint: disable=cyclic-import
 from pymovements._utils._checks import check_is_mutual_exclusive
@@ -1082,11 +1081,7 @@ class GazeDataFrame:
         else:
             raise ValueError('neither position nor pixel in gaze dataframe, one needed for mapping')
 
-        aois = [
-            aoi_dataframe.get_aoi(row=row, x_eye=x_eye, y_eye=y_eye)
-            for row in tqdm(self.frame.iter_rows(named=True))
-        ]
-        aoi_df = pl.concat(aois)
+        aoi_df = aoi_dataframe.get_aois(self.frame, x_eye=x_eye, y_eye=y_eye)
         self.frame = pl.concat([self.frame, aoi_df], how='horizontal')
 
     def nest(
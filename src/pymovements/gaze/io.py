@@ -20,6 +20,7 @@
 """Functionality to load GazeDataFrame from a csv file."""
 from __future__ import annotations
 
+import inspect
 import math
 from pathlib import Path
 from typing import Any
@@ -33,6 +34,13 @@ from pymovements.gaze.experiment import Experiment
 from pymovements.gaze.gaze_dataframe import GazeDataFrame
 
 
+# Keyword arguments which can be forwarded to polars.scan_csv instead of polars.read_csv.
+_SCAN_CSV_PARAMETERS = frozenset(inspect.signature(pl.scan_csv).parameters)
+
+# Encodings supported by polars.scan_csv. polars.read_csv additionally decodes other encodings.
+_SCAN_CSV_ENCODINGS = frozenset({'utf8', 'utf8-lossy'})
+
+
 def from_csv(
         file: str | Path,
         experiment: Experiment | None = None,
@@ -110,7 +118,8 @@ def from_csv(
     **read_csv_kwargs: Any
         Additional keyword arguments to be passed to :py:func:`polars.read_csv` to read in the csv.
         These can include custom separators, a subset of columns, or specific data types
-        for columns.
+        for columns. If all arguments are also supported by :py:func:`polars.scan_csv` in the
+        same way, the file is scanned lazily instead.
 
     Returns
     -------
@@ -232,23 +241,38 @@ def from_csv(
             if definition.custom_read_kwargs['gaze']:
                 read_csv_kwargs = definition.custom_read_kwargs['gaze']
 
-    # Read data.
-    gaze_data = pl.read_csv(file, **read_csv_kwargs)
+    # Read data lazily if possible, so that renaming and casting are fused into a single pass.
+    if (
+        isinstance(file, (str, Path))
+        and _SCAN_CSV_PARAMETERS.issuperset(read_csv_kwargs)
+        and read_csv_kwargs.get('encoding', 'utf8') in _SCAN_CSV_ENCODINGS
+        # polars.scan_csv only accepts schema_overrides as a dict, and applies them after
+        # renaming the columns to new_columns instead of before.
+        and isinstance(read_csv_kwargs.get('schema_overrides', {}), dict)
+        and 'new_columns' not in read_csv_kwargs
+    ):
+        gaze_data = pl.scan_csv(file, **read_csv_kwargs)
+    else:
+        gaze_data = pl.read_csv(file, **read_csv_kwargs).lazy()
+    schema = gaze_data.collect_schema()
+
     if column_map is not None:
         gaze_data = gaze_data.rename({
             key: column_map[key] for key in
             [
                 key for key in column_map.keys()
-                if key in gaze_data.columns
+                if key in schema
             ]
         })
+        schema = gaze_data.collect_schema()
 
     if add_columns is not None:
         gaze_data = gaze_data.with_columns([
             pl.lit(value).alias(column)
             for column, value in add_columns.items()
-            if column not in gaze_data.columns
+            if column not in schema
         ])
+        schema = gaze_data.collect_schema()
 
     # Cast numerical columns to Float64 if they were incorrectly inferred to be Utf8.
     # This can happen if the column only has missing values in the top 100 rows.
@@ -260,10 +284,13 @@ def from_csv(
         + ([distance_column] if distance_column else [])
     )
     for column in numerical_columns:
-        if gaze_data[column].dtype == pl.Utf8:
-            gaze_data = gaze_data.with_columns([
-                pl.col(column).cast(pl.Float64),
-            ])
+        if column not in schema:
+            raise pl.exceptions.ColumnNotFoundError(f'"{column}" not found')
+    gaze_data = gaze_data.with_columns([
+        pl.col(column).cast(pl.Float64)
+        for column in numerical_columns
+        if schema[column] == pl.Utf8
+    ])
 
     if column_schema_overrides is not None:
         gaze_data = gaze_data.with_columns([
@@ -273,7 +300,7 @@ def from_csv(
 
     # Create gaze data frame.
     gaze_df = GazeDataFrame(
-        gaze_data,
+        gaze_data.collect(),
         experiment=experiment,
         definition=definition,
         trial_columns=trial_columns,
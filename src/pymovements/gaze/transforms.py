@@ -276,14 +276,14 @@ def pix2deg(
             f'`{type(distance).__name__}`',
         )
 
-    distance_pixels = pl.concat_list([
-        distance_series.mul(screen_resolution[component % 2] / screen_size[component % 2])
-        for component in range(n_components)
-    ])
+    # Pixels per centimeter are constant per axis, so the distance is scaled per component
+    # instead of being packed into an intermediate list column.
+    pixels_per_cm = [screen_resolution[axis] / screen_size[axis] for axis in range(2)]
 
     degree_components = [
         pl.arctan2(
-            centered_pixels.list.get(component), distance_pixels.list.get(component),
+            centered_pixels.list.get(component),
+            distance_series.mul(pixels_per_cm[component % 2]),
         ).degrees()
         for component in range(n_components)
     ]
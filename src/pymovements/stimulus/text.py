@@ -24,12 +24,17 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import polars as pl
 
 from pymovements._utils import _checks
 from pymovements._utils._html import repr_html
 
 
+# Maximum number of point-aoi comparisons that TextStimulus.get_aois() evaluates at once.
+_GET_AOIS_BLOCK_SIZE = 1 << 22
+
+
 @repr_html(['aois'])
 class TextStimulus:
     """A DataFrame for the text stimulus that the gaze data was recorded on.
@@ -150,6 +155,91 @@ class TextStimulus:
         """
         return _get_aoi(self, row=row, x_eye=x_eye, y_eye=y_eye)
 
+    def get_aois(
+            self,
+            frame: pl.DataFrame,
+            *,
+            x_eye: str,
+            y_eye: str,
+    ) -> pl.DataFrame:
+        """Given an eye movement dataframe, return the aoi for each of its rows.
+
+        The bounding boxes are computed as in :py:meth:`get_aoi`, but all rows are compared against
+        all aois in vectorized blocks instead of filtering the aois for every row. If multiple
+        aois contain a point, the first one is returned.
+
+        Parameters
+        ----------
+        frame: pl.DataFrame
+            Eye movement dataframe.
+        x_eye: str
+            Name of x eye coordinate.
+        y_eye: str
+            Name of y eye coordinate.
+
+        Returns
+        -------
+        pl.DataFrame
+            Looked at areas of interest with one row for each row in ``frame``. Rows without an
+            area of interest are null.
+
+        Raises
+        ------
+        ValueError
+            If width and end_TYPE_column is None.
+        """
+        if self.width_column is not None:
+            _checks.check_is_none_is_mutual(
+                height_column=self.width_column,
+                width_column=self.height_column,
+            )
+            # mypy does not get that height_column cannot be None here.
+            assert self.height_column is not None
+            end_x = pl.col(self.start_x_column) + pl.col(self.width_column)
+            end_y = pl.col(self.start_y_column) + pl.col(self.height_column)
+        elif self.end_x_column is not None:
+            _checks.check_is_none_is_mutual(
+                end_x_column=self.end_x_column,
+                end_y_column=self.end_y_column,
+            )
+            assert self.end_y_column is not None
+            end_x = pl.col(self.end_x_column)
+            end_y = pl.col(self.end_y_column)
+        else:
+            raise ValueError(
+                'either TextStimulus.width or TextStimulus.end_x_column must be defined',
+            )
+
+        bounds = self.aois.select(
+            pl.col(self.start_x_column).cast(pl.Float64).alias('start_x'),
+            pl.col(self.start_y_column).cast(pl.Float64).alias('start_y'),
+            end_x.cast(pl.Float64).alias('end_x'),
+            end_y.cast(pl.Float64).alias('end_y'),
+        )
+        aoi_start_x, aoi_start_y, aoi_end_x, aoi_end_y = (
+            bounds.get_column(column).to_numpy() for column in bounds.columns
+        )
+        # Null coordinates become nan, which are never inside a bounding box.
+        points_x = frame.get_column(x_eye).cast(pl.Float64).to_numpy()[:, np.newaxis]
+        points_y = frame.get_column(y_eye).cast(pl.Float64).to_numpy()[:, np.newaxis]
+
+        # Compare blocks of points against all aois at once, keeping the boolean matrix of each
+        # block to about _GET_AOIS_BLOCK_SIZE elements.
+        aoi_indices = np.full(len(frame), -1, dtype=np.int64)
+        block_length = max(_GET_AOIS_BLOCK_SIZE // max(len(bounds), 1), 1)
+        for block_start in range(0, len(frame) if len(bounds) else 0, block_length):
+            block = slice(block_start, block_start + block_length)
+            hits = (
+                (aoi_start_x <= points_x[block]) & (points_x[block] < aoi_end_x) &
+                (aoi_start_y <= points_y[block]) & (points_y[block] < aoi_end_y)
+            )
+            first_hits = hits.argmax(axis=1)
+            aoi_indices[block] = np.where(hits.any(axis=1), first_hits, -1)
+
+        # Gathering with a null index yields a null row for points outside of all aois.
+        indices = pl.Series(aoi_indices)
+        return self.aois.select(pl.all().gather(pl.when(indices >= 0).then(indices)))
+
 
 def from_file(
         aoi_path: str | Path,
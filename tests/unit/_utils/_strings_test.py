@@ -94,3 +94,9 @@ from pymovements._utils._strings import curly_to_regex
 )
 def test_curly_to_regex(pattern, expected_regex):
     assert curly_to_regex(pattern) == expected_regex
+
+
+def test_curly_to_regex_is_cached():
+    pattern = '{subject_id:d}_{session_name}.csv'
+
+    assert curly_to_regex(pattern) is curly_to_regex(pattern)
@@ -24,6 +24,7 @@ from unittest import mock
 
 import pytest
 
+from pymovements.dataset._utils._downloads import _calculate_md5
 from pymovements.dataset._utils._downloads import _DownloadProgressBar
 from pymovements.dataset._utils._downloads import _get_redirected_url
 from pymovements.dataset._utils._downloads import download_file
@@ -159,3 +160,12 @@ def test__DownloadProgressBar_tsize_not_None():
     download_progress_bar.update_to(tsize=100)
     assert download_progress_bar.n == 1
     assert download_progress_bar.total == 100
+
+
+@pytest.mark.parametrize('size', [0, 1, 1024 * 1024 + 1])
+def test__calculate_md5(tmp_path, size):
+    filepath = tmp_path / 'file.bin'
+    content = os.urandom(size)
+    filepath.write_bytes(content)
+
+    assert _calculate_md5(filepath) == hashlib.md5(content).hexdigest()
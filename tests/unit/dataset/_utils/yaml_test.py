@@ -18,9 +18,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """Test pymovements paths."""
+import sys
+
 import pytest
 import yaml
 
+from pymovements.dataset._utils._yaml import intern_strings
 from pymovements.dataset._utils._yaml import type_constructor
 
 
@@ -64,3 +67,16 @@ def test_unknown_attribute_error(tmp_path):
             yaml.safe_load(f)
     msg, = excinfo.value.args
     assert msg == 'Unknown type: notexisting for module yaml'
+
+
+def test_intern_strings():
+    # Build strings at runtime, so that they are not interned by the compiler.
+    filename = ''.join(['test', '.csv'])
+    data = {'gaze': [{''.join(['file', 'name']): filename, 'md5': None}]}
+
+    interned = intern_strings(data)
+
+    assert interned == data
+    key, = interned['gaze'][0].keys() - {'md5'}
+    assert key is sys.intern('filename')
+    assert interned['gaze'][0]['filename'] is sys.intern('test.csv')
@@ -20,7 +20,9 @@
 """Test dataset definition."""
 import re
 from dataclasses import dataclass
+from unittest import mock
 
+import polars as pl
 import pytest
 import yaml
 
@@ -28,6 +30,7 @@ from pymovements import __version__
 from pymovements import DatasetDefinition
 from pymovements import DatasetLibrary
 from pymovements import Experiment
+from pymovements.dataset.dataset_definition import _clear_from_yaml_cache
 
 
 @pytest.mark.parametrize(
@@ -342,6 +345,39 @@ def test_write_yaml_already_existing_dataset_definition_w_tuple_screen(tmp_path)
     assert DatasetDefinition.from_yaml(tmp_file) == definition
 
 
+def test_dataset_definition_to_dict_does_not_share_containers():
+    definition = DatasetDefinition(
+        name='Example',
+        column_map={'x': 'x_pix'},
+        trial_columns=['subject_id'],
+    )
+
+    data = definition.to_dict()
+    data['column_map']['y'] = 'y_pix'
+    data['trial_columns'].append('trial_id')
+
+    assert definition.column_map == {'x': 'x_pix'}
+    assert definition.trial_columns == ['subject_id']
+
+
+def test_dataset_definition_to_yaml_tuples_are_safe_loadable(tmp_path):
+    tmp_file = tmp_path / 'tmp.yaml'
+    definition = DatasetDefinition(
+        name='Example',
+        mirrors={'gaze': ('https://example.com/', 'https://another_example.com/')},
+        trial_columns=('subject_id', 'trial_id'),
+    )
+    definition.to_yaml(tmp_file)
+
+    with open(tmp_file, encoding='utf-8') as f:
+        yaml_dict = yaml.safe_load(f)
+
+    assert yaml_dict['mirrors'] == {
+        'gaze': ['https://example.com/', 'https://another_example.com/'],
+    }
+    assert yaml_dict['trial_columns'] == ['subject_id', 'trial_id']
+
+
 def test_check_equality_of_load_from_yaml_and_load_from_dictionary_dump(tmp_path):
     dictionary_tmp_file = tmp_path / 'dictionary.yaml'
     yaml_encoding = {
@@ -370,6 +406,86 @@ def test_check_equality_of_load_from_yaml_and_load_from_dictionary_dump(tmp_path
     assert yaml_definition == expected_definition
 
 
+def test_dataset_definition_from_yaml_resolves_type_tags(tmp_path):
+    tmp_file = tmp_path / 'tmp.yaml'
+    tmp_file.write_text(
+        'name: Example\n'
+        'filename_format_schema_overrides:\n'
+        '  gaze:\n'
+        '    subject_id: !int\n'
+        '    text_id: !polars.Utf8\n',
+        encoding='utf-8',
+    )
+
+    definition = DatasetDefinition.from_yaml(tmp_file)
+
+    assert definition.filename_format_schema_overrides == {
+        'gaze': {'subject_id': int, 'text_id': pl.Utf8},
+    }
+
+
+def test_dataset_definition_from_yaml_cached_returns_independent_copies(tmp_path):
+    tmp_file = tmp_path / 'tmp.yaml'
+    tmp_file.write_text('name: Example\nmirrors:\n  gaze:\n    - https://a/\n', encoding='utf-8')
+
+    definition1 = DatasetDefinition.from_yaml(tmp_file)
+    definition1.mirrors['gaze'].append('https://b/')
+    definition2 = DatasetDefinition.from_yaml(tmp_file)
+
+    assert definition2.mirrors == {'gaze': ['https://a/']}
+
+
+def test_dataset_definition_from_yaml_cache_invalidated_on_change(tmp_path):
+    tmp_file = tmp_path / 'tmp.yaml'
+    tmp_file.write_text('name: A\n', encoding='utf-8')
+    assert DatasetDefinition.from_yaml(tmp_file).name == 'A'
+
+    tmp_file.write_text('name: Changed\n', encoding='utf-8')
+    assert DatasetDefinition.from_yaml(tmp_file).name == 'Changed'
+
+
+def test_dataset_definition_clear_from_yaml_cache(tmp_path):
+    tmp_file = tmp_path / 'tmp.yaml'
+    tmp_file.write_text('name: A\n', encoding='utf-8')
+
+    with mock.patch('yaml.load', wraps=yaml.load) as yaml_load:
+        DatasetDefinition.from_yaml(tmp_file)
+        DatasetDefinition.from_yaml(tmp_file)
+        assert yaml_load.call_count == 1
+
+        _clear_from_yaml_cache()
+        DatasetDefinition.from_yaml(tmp_file)
+
+        assert yaml_load.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ('content', 'expected_name'),
+    [
+        pytest.param('name: Example\n', 'Example', id='name_only'),
+        pytest.param('name: "Example"\n', 'Example', id='quoted_name'),
+        pytest.param(
+            'long_name: Other\nmirrors:\n  gaze:\n    - name: nested\nname: Example\n',
+            'Example',
+            id='name_after_nested_mapping',
+        ),
+        pytest.param('long_name: Example\n', None, id='no_name'),
+        pytest.param('experiment:\n  name: Example\n', None, id='only_nested_name'),
+        pytest.param('- name\n- Example\n', None, id='top_level_sequence'),
+        pytest.param('name:\n  nested: Example\n', None, id='name_is_mapping'),
+        pytest.param('long_name: &n Foo\nname: *n\nmirrors: {}\n', None, id='name_is_alias'),
+        pytest.param('name: 2024\n', None, id='name_is_int'),
+        pytest.param('name: !!str 2024\n', None, id='name_has_explicit_tag'),
+        pytest.param("name: '2024'\n", '2024', id='name_is_quoted_int'),
+    ],
+)
+def test_dataset_definition_peek_name(content, expected_name, tmp_path):
+    tmp_file = tmp_path / 'tmp.yaml'
+    tmp_file.write_text(content, encoding='utf-8')
+
+    assert DatasetDefinition.peek_name(tmp_file) == expected_name
+
+
 @pytest.mark.parametrize(
     ('resources', 'expected_has_resources'),
     [
@@ -793,3 +909,11 @@ def test_dataset_definition_attribute_is_removed(attribute_kwarg):
         f'utils/parsing.py was planned to be removed in v{remove_version}. '
         f'Current version is v{current_version}.'
     )
+
+
+def test_dataset_definition_mirror_without_trailing_slash_raises_value_error():
+    with pytest.raises(ValueError) as excinfo:
+        DatasetDefinition(mirrors={'gaze': ['https://example.com/', 'https://example.com']})
+
+    msg, = excinfo.value.args
+    assert msg == "gaze mirror must end with a '/' (mirror = https://example.com)"
@@ -20,7 +20,9 @@
 """Test all download and extract functionality of pymovements.Dataset."""
 from __future__ import annotations
 
+import json
 import shutil
+import zipfile
 from pathlib import Path
 from unittest import mock
 
@@ -1399,3 +1401,276 @@ def test_dataset_download_no_precomputed_rm_resources_raises_exception(tmp_path)
 
     expected_msg = 'resources must be specified to download dataset.'
     assert msg == expected_msg
+
+
+@pytest.fixture(name='multiple_resources_definition')
+def multiple_resources_definition_fixture():
+    return DatasetDefinition(
+        name='CustomPublicDataset',
+        has_files={
+            'gaze': True,
+            'precomputed_events': False,
+            'precomputed_reading_measures': False,
+        },
+        resources={
+            'gaze': tuple(
+                {
+                    'resource': f'https://example.com/test_{idx}.gz.tar',
+                    'filename': f'test_{idx}.gz.tar',
+                    'md5': '52bbf03a7c50ee7152ccb9d357c2bb30',
+                }
+                for idx in range(3)
+            ),
+        },
+    )
+
+
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_multiple_resources(
+        mock_download_file, tmp_path, multiple_resources_definition,
+):
+    paths = DatasetPaths(root=tmp_path, dataset='.')
+    Dataset(multiple_resources_definition, path=paths).download(extract=False)
+
+    mock_download_file.assert_has_calls(
+        [
+            mock.call(
+                url=f'https://example.com/test_{idx}.gz.tar',
+                dirpath=tmp_path / 'downloads',
+                filename=f'test_{idx}.gz.tar',
+                md5='52bbf03a7c50ee7152ccb9d357c2bb30',
+                verbose=True,
+            )
+            for idx in range(3)
+        ],
+        any_order=True,
+    )
+    assert mock_download_file.call_count == 3
+
+
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_multiple_resources_fail(
+        mock_download_file, tmp_path, multiple_resources_definition,
+):
+    def download_file_side_effect(url, **kwargs):  # pylint: disable=unused-argument
+        if not url.endswith('test_1.gz.tar'):
+            raise OSError()
+
+    mock_download_file.side_effect = download_file_side_effect
+
+    paths = DatasetPaths(root=tmp_path, dataset='.')
+    dataset = Dataset(multiple_resources_definition, path=paths)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        dataset.download(extract=False)
+
+    msg, = excinfo.value.args
+    assert msg == (
+        'downloading 2 resources failed:\n'
+        'downloading resource https://example.com/test_0.gz.tar failed.\n'
+        'downloading resource https://example.com/test_2.gz.tar failed.'
+    )
+    assert mock_download_file.call_count == 3
+
+
+def test_dataset_extract_multiple_resources(tmp_path):
+    definition = DatasetDefinition(
+        name='CustomPublicDataset',
+        has_files={
+            'gaze': True,
+            'precomputed_events': False,
+            'precomputed_reading_measures': False,
+        },
+        resources={
+            'gaze': (
+                {'resource': 'a.zip', 'filename': 'a.zip', 'md5': None},
+                {'resource': 'b.zip', 'filename': 'b.zip', 'md5': None},
+                {'resource': 'c.csv', 'filename': 'c.csv', 'md5': None},
+            ),
+        },
+    )
+
+    downloads_dirpath = tmp_path / 'downloads'
+    downloads_dirpath.mkdir()
+
+    nested_archive_path = tmp_path / 'nested.zip'
+    with zipfile.ZipFile(nested_archive_path, 'w') as archive:
+        archive.writestr('nested.csv', 'x,y\n1,2\n')
+
+    with zipfile.ZipFile(downloads_dirpath / 'a.zip', 'w') as archive:
+        archive.writestr('a.csv', 'x,y\n1,2\n')
+        archive.write(nested_archive_path, 'nested.zip')
+    with zipfile.ZipFile(downloads_dirpath / 'b.zip', 'w') as archive:
+        archive.writestr('b.csv', 'x,y\n1,2\n')
+    (downloads_dirpath / 'c.csv').write_text('x,y\n1,2\n', encoding='utf-8')
+
+    Dataset(definition, path=tmp_path).extract(verbose=0)
+
+    raw_dirpath = tmp_path / 'raw'
+    assert (raw_dirpath / 'a.csv').is_file()
+    assert (raw_dirpath / 'nested' / 'nested.csv').is_file()
+    assert (raw_dirpath / 'b.csv').is_file()
+    assert (raw_dirpath / 'c.csv').is_file()
+
+
+@mock.patch('pymovements.dataset.dataset_download.os.cpu_count', return_value=8)
+def test_dataset_extract_multiple_resources_with_overlapping_directories(
+        mock_cpu_count, tmp_path,  # pylint: disable=unused-argument
+):
+    filenames = [f'{i}.zip' for i in range(6)]
+    definition = DatasetDefinition(
+        name='CustomPublicDataset',
+        has_files={
+            'gaze': True,
+            'precomputed_events': False,
+            'precomputed_reading_measures': False,
+        },
+        resources={
+            'gaze': tuple(
+                {'resource': filename, 'filename': filename, 'md5': None}
+                for filename in filenames
+            ),
+        },
+    )
+
+    downloads_dirpath = tmp_path / 'downloads'
+    downloads_dirpath.mkdir()
+    for i, filename in enumerate(filenames):
+        with zipfile.ZipFile(downloads_dirpath / filename, 'w') as archive:
+            for j in range(20):
+                archive.writestr(f'data/sub{j}/deep/{i}.csv', 'x,y\n1,2\n')
+
+    Dataset(definition, path=tmp_path).extract(verbose=0)
+
+    raw_dirpath = tmp_path / 'raw'
+    for i in range(6):
+        for j in range(20):
+            assert (raw_dirpath / 'data' / f'sub{j}' / 'deep' / f'{i}.csv').is_file()
+
+
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_skips_extracted_resources(mock_download_file, tmp_path):
+    definition = DatasetDefinition(
+        name='CustomPublicDataset',
+        has_files={
+            'gaze': True,
+            'precomputed_events': False,
+            'precomputed_reading_measures': False,
+        },
+        resources={
+            'gaze': (
+                {'resource': 'https://example.com/a.csv', 'filename': 'a.csv', 'md5': 'abc'},
+                {'resource': 'https://example.com/b.csv', 'filename': 'b.csv', 'md5': 'def'},
+            ),
+        },
+    )
+
+    def download_file_side_effect(
+            url, dirpath, filename, **kwargs,  # pylint: disable=unused-argument
+    ):
+        dirpath.mkdir(parents=True, exist_ok=True)
+        (dirpath / filename).write_text('x,y\n1,2\n', encoding='utf-8')
+
+    mock_download_file.side_effect = download_file_side_effect
+    dataset = Dataset(definition, path=tmp_path)
+
+    dataset.download(verbose=False)
+    assert mock_download_file.call_count == 2
+    assert (tmp_path / 'raw' / 'a.csv').is_file()
+    assert (tmp_path / 'raw' / 'b.csv').is_file()
+
+    dataset.download(verbose=False)
+    assert mock_download_file.call_count == 2
+
+    # A changed checksum invalidates the previous extraction of this resource only.
+    dataset.definition.resources['gaze'][1]['md5'] = 'ghi'
+    dataset.download(verbose=False)
+    assert mock_download_file.call_count == 3
+    assert mock_download_file.call_args.kwargs['filename'] == 'b.csv'
+
+    # Without extraction, all resources are checked again.
+    dataset.download(extract=False, verbose=False)
+    assert mock_download_file.call_count == 5
+
+
+@pytest.mark.parametrize(
+    'manifest_content',
+    [
+        pytest.param('{"a.csv": "ab', id='truncated'),
+        pytest.param('["a.csv"]', id='not_a_mapping'),
+    ],
+)
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_ignores_unreadable_extracted_manifest(
+        mock_download_file, manifest_content, tmp_path,
+):
+    definition = DatasetDefinition(
+        name='CustomPublicDataset',
+        has_files={
+            'gaze': True,
+            'precomputed_events': False,
+            'precomputed_reading_measures': False,
+        },
+        resources={
+            'gaze': (
+                {'resource': 'https://example.com/a.csv', 'filename': 'a.csv', 'md5': 'abc'},
+            ),
+        },
+    )
+
+    def download_file_side_effect(
+            url, dirpath, filename, **kwargs,  # pylint: disable=unused-argument
+    ):
+        dirpath.mkdir(parents=True, exist_ok=True)
+        (dirpath / filename).write_text('x,y\n1,2\n', encoding='utf-8')
+
+    mock_download_file.side_effect = download_file_side_effect
+    manifest_path = tmp_path / 'raw' / '.pymovements_extracted.json'
+    manifest_path.parent.mkdir(parents=True)
+    manifest_path.write_text(manifest_content, encoding='utf-8')
+
+    Dataset(definition, path=tmp_path).download(verbose=False)
+
+    assert mock_download_file.call_count == 1
+    assert json.loads(manifest_path.read_text(encoding='utf-8')) == {'a.csv': 'abc'}
+    assert not manifest_path.with_name('.pymovements_extracted.json.tmp').exists()
+
+
+@mock.patch('pymovements.dataset.dataset_download.os.cpu_count', return_value=8)
+@mock.patch('pymovements.dataset.dataset_download.download_file')
+def test_dataset_download_extracts_multiple_resources_with_overlapping_directories(
+        mock_download_file, mock_cpu_count, tmp_path,  # pylint: disable=unused-argument
+):
+    filenames = [f'{i}.zip' for i in range(6)]
+    definition = DatasetDefinition(
+        name='CustomPublicDataset',
+        has_files={
+            'gaze': True,
+            'precomputed_events': False,
+            'precomputed_reading_measures': False,
+        },
+        resources={
+            'gaze': tuple(
+                {'resource': f'https://example.com/{filename}', 'filename': filename, 'md5': None}
+                for filename in filenames
+            ),
+        },
+    )
+
+    def download_file_side_effect(
+            url, dirpath, filename, **kwargs,  # pylint: disable=unused-argument
+    ):
+        dirpath.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(dirpath / filename, 'w') as archive:
+            for j in range(20):
+                archive.writestr(f'data/sub{j}/deep/{filename}.csv', 'x,y\n1,2\n')
+
+    mock_download_file.side_effect = download_file_side_effect
+
+    Dataset(definition, path=tmp_path).download(extract=True, verbose=False)
+
+    assert mock_download_file.call_count == 6
+    raw_dirpath = tmp_path / 'raw'
+    for filename in filenames:
+        for j in range(20):
+            assert (raw_dirpath / 'data' / f'sub{j}' / 'deep' / f'{filename}.csv').is_file()
@@ -20,6 +20,8 @@
 """Tests pymovements asc to csv processing."""
 # flake8: noqa: E101, W191, E501
 # pylint: disable=duplicate-code
+from unittest import mock
+
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
@@ -274,3 +276,56 @@ def test_load_precomputed_file_unsupported_file_format():
 
     msg, = exc.value.args
     assert msg == 'unsupported file format ".feather". Supported formats are: .csv, .tsv, .txt'
+
+
+@pytest.fixture(name='gaze_files_configuration')
+def fixture_gaze_files_configuration(tmp_path):
+    paths = pm.DatasetPaths(root=tmp_path, dataset='.')
+    paths.raw.mkdir(parents=True)
+
+    # Files differ in length, so that they are likely to finish loading out of order.
+    subject_ids = [1, 2, 3, 4, 5, 6]
+    for subject_id in subject_ids:
+        n_rows = 1000 * (len(subject_ids) - subject_id + 1)
+        pl.DataFrame({
+            'time': range(n_rows),
+            'x': [float(subject_id)] * n_rows,
+            'y': [0.0] * n_rows,
+        }).write_csv(paths.raw / f'{subject_id}.csv')
+
+    fileinfo = pl.DataFrame({
+        'subject_id': subject_ids,
+        'filepath': [f'{subject_id}.csv' for subject_id in subject_ids],
+    })
+    definition = DatasetDefinition(
+        time_column='time',
+        time_unit='ms',
+        pixel_columns=['x', 'y'],
+        filename_format_schema_overrides={'gaze': {'subject_id': pl.Int64}},
+    )
+    return definition, fileinfo, paths
+
+
+@mock.patch('pymovements.dataset.dataset_files.os.cpu_count', return_value=4)
+def test_load_gaze_files_concurrently_keeps_fileinfo_order(
+        mock_cpu_count, gaze_files_configuration,  # pylint: disable=unused-argument
+):
+    definition, fileinfo, paths = gaze_files_configuration
+
+    gaze_dfs = pm.dataset.dataset_files.load_gaze_files(definition, fileinfo, paths)
+
+    assert len(gaze_dfs) == len(fileinfo)
+    for subject_id, gaze_df in zip(fileinfo['subject_id'], gaze_dfs):
+        assert gaze_df.frame['subject_id'].unique().to_list() == [subject_id]
+        assert gaze_df.frame['pixel'].list.get(0).unique().to_list() == [subject_id]
+
+
+@mock.patch('pymovements.dataset.dataset_files.os.cpu_count', return_value=4)
+def test_load_gaze_files_concurrently_raises_error_of_single_file(
+        mock_cpu_count, gaze_files_configuration,  # pylint: disable=unused-argument
+):
+    definition, fileinfo, paths = gaze_files_configuration
+    (paths.raw / '3.csv').unlink()
+
+    with pytest.raises(FileNotFoundError, match='3.csv'):
+        pm.dataset.dataset_files.load_gaze_files(definition, fileinfo, paths)
@@ -23,7 +23,6 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
-import yaml
 
 from pymovements import DatasetDefinition
 from pymovements import DatasetLibrary
@@ -83,6 +82,37 @@ def test_register_definition_class():
     assert definition == CustomDatasetDefinition()
 
 
+def test_add_yaml_definition_is_loaded_on_first_access(tmp_path):
+    yaml_file = tmp_path / 'custom.yaml'
+    yaml_file.write_text('name: CustomYamlDefinition\nlong_name: Custom\n', encoding='utf-8')
+
+    with mock.patch.object(
+        DatasetDefinition, 'from_yaml', wraps=DatasetDefinition.from_yaml,
+    ) as from_yaml:
+        DatasetLibrary.add(yaml_file)
+
+        assert 'CustomYamlDefinition' in DatasetLibrary.definitions
+        assert 'CustomYamlDefinition' in DatasetLibrary.names()
+        from_yaml.assert_not_called()
+
+        definition = DatasetLibrary.get('CustomYamlDefinition')
+
+        from_yaml.assert_called_once()
+
+    assert definition == DatasetDefinition(name='CustomYamlDefinition', long_name='Custom')
+
+
+def test_add_yaml_definition_with_aliased_name(tmp_path):
+    yaml_file = tmp_path / 'custom.yaml'
+    yaml_file.write_text(
+        'long_name: &n AliasedYamlDefinition\nname: *n\nmirrors: {}\n', encoding='utf-8',
+    )
+
+    DatasetLibrary.add(yaml_file)
+
+    assert DatasetLibrary.get('AliasedYamlDefinition').name == 'AliasedYamlDefinition'
+
+
 def test_library_not_empty():
     assert len(DatasetLibrary.definitions) >= 0
 
@@ -111,9 +141,7 @@ def test_dataset_library_contains_all_public_datasets_files():
         dataset_path = Path(filename)
         if dataset_path.name == 'datasets.yaml':
             continue
-        with open(filename, encoding='ascii') as f:
-            dataset_file = yaml.safe_load(f)
-        dataset_name = dataset_file['name']
+        dataset_name = DatasetDefinition.from_yaml(dataset_path).name
         assert dataset_name in library, f'please add {dataset_name} to `datasets.yaml`'
 
 
@@ -89,3 +89,13 @@ def test_filters(params, expected):
             params['values'],
         )
         assert np.all(np.array(expected['values_split']) == np.array(results))
+
+
+def test_filter_candidates_remove_nans_only_nan_candidate():
+    values = np.array([(np.nan, np.nan), (np.nan, np.nan), (0, 0), (np.nan, np.nan), (0, 0)])
+
+    results = filter_candidates_remove_nans([[0, 1], [2, 3, 4]], values)
+
+    assert len(results) == 2
+    assert len(results[0]) == 0
+    np.testing.assert_array_equal(results[1], [2, 3, 4])
@@ -26,48 +26,29 @@ import pymovements as pm
 
 EXPECTED_DF = {
     'char_left_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -88,51 +69,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_right_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -153,51 +114,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'word_left_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -218,51 +159,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'word_right_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -283,51 +204,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_left_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -348,51 +249,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_right_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -413,52 +294,32 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
 
     'word_left_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -479,51 +340,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'word_right_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -544,51 +385,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_auto_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -609,51 +430,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_auto_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -674,52 +475,32 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
 
     'word_auto_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -740,51 +521,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'word_auto_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -805,51 +566,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_else_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -870,51 +611,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'char_else_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -935,51 +656,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'word_else_pixel': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'pixel_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'pixel_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'pixel_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'pixel_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -1000,51 +701,31 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
     'word_else_position': pl.DataFrame(
-        [
-            (
-                1, 1, 8005274, 649.5, 531.1, 640.6, 529.1, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005275, 649.8, 533.2, 639.7, 528.9, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005276, 647.7, 534.0, 640.6, 529.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005277, 646.2, 533.0, 642.1, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005278, 646.5, 533.7, 642.9, 531.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005279, 647.2, 534.6, 642.6, 531.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005280, 647.3, 534.0, 642.3, 530.6, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005281, 647.7, 536.3, 642.2, 529.4, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005282, 647.5, 537.0, 641.4, 531.3, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-            (
-                1, 1, 8005283, 648.3, 534.9, 640.9, 529.0, None, None,
-                None, None, None, None, None, None, None, None, None,
-            ),
-        ],
+        {
+            'trialId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'pointId': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            'time': [
+                8005274, 8005275, 8005276, 8005277, 8005278, 8005279, 8005280, 8005281, 8005282,
+                8005283,
+            ],
+            'position_xl': [649.5, 649.8, 647.7, 646.2, 646.5, 647.2, 647.3, 647.7, 647.5, 648.3],
+            'position_yl': [531.1, 533.2, 534.0, 533.0, 533.7, 534.6, 534.0, 536.3, 537.0, 534.9],
+            'position_xr': [640.6, 639.7, 640.6, 642.1, 642.9, 642.6, 642.3, 642.2, 641.4, 640.9],
+            'position_yr': [529.1, 528.9, 529.3, 531.3, 531.0, 531.6, 530.6, 529.4, 531.3, 529.0],
+            'char': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'top_left_y': [None, None, None, None, None, None, None, None, None, None],
+            'width': [None, None, None, None, None, None, None, None, None, None],
+            'height': [None, None, None, None, None, None, None, None, None, None],
+            'char_idx_in_line': [None, None, None, None, None, None, None, None, None, None],
+            'line_idx': [None, None, None, None, None, None, None, None, None, None],
+            'page': [None, None, None, None, None, None, None, None, None, None],
+            'word': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_x': [None, None, None, None, None, None, None, None, None, None],
+            'bottom_left_y': [None, None, None, None, None, None, None, None, None, None],
+        },
         schema={
             'trialId': pl.Int64,
             'pointId': pl.Int64,
@@ -1065,7 +746,6 @@ EXPECTED_DF = {
             'bottom_left_x': pl.Float64,
             'bottom_left_y': pl.Float64,
         },
-        orient='row',
     ),
 }
 
@@ -307,6 +307,60 @@ from pymovements.gaze import from_csv
             },
             id='sbsat_dataset_example',
         ),
+
+        pytest.param(
+            {
+                'file': 'tests/files/monocular_example.csv',
+                'time_column': 'time',
+                'time_unit': 'ms',
+                'pixel_columns': ['x_left_pix', 'y_left_pix'],
+                'columns': ['time', 'x_left_pix', 'y_left_pix'],
+                'n_threads': 1,
+            },
+            (10, 2),
+            {'time': pl.Int64, 'pixel': pl.List(pl.Int64)},
+            id='csv_read_csv_only_kwargs',
+        ),
+
+        pytest.param(
+            {
+                'file': 'tests/files/monocular_example.csv',
+                'time_column': 'time',
+                'time_unit': 'ms',
+                'pixel_columns': ['x_left_pix', 'y_left_pix'],
+                'encoding': 'latin1',
+            },
+            (10, 2),
+            {'time': pl.Int64, 'pixel': pl.List(pl.Int64)},
+            id='csv_non_utf8_encoding',
+        ),
+
+        pytest.param(
+            {
+                'file': 'tests/files/monocular_example.csv',
+                'time_column': 'time',
+                'time_unit': 'ms',
+                'pixel_columns': ['x_left_pix', 'y_left_pix'],
+                'schema_overrides': [pl.Int64, pl.Float32, pl.Float32],
+            },
+            (10, 2),
+            {'time': pl.Int64, 'pixel': pl.List(pl.Float32)},
+            id='csv_schema_overrides_list',
+        ),
+
+        pytest.param(
+            {
+                'file': 'tests/files/monocular_example.csv',
+                'time_column': 't',
+                'time_unit': 'ms',
+                'pixel_columns': ['x', 'y'],
+                'new_columns': ['t', 'x', 'y'],
+                'schema_overrides': {'x_left_pix': pl.Float32, 'y_left_pix': pl.Float32},
+            },
+            (10, 2),
+            {'time': pl.Int64, 'pixel': pl.List(pl.Float32)},
+            id='csv_new_columns_with_schema_overrides',
+        ),
     ],
 )
 def test_from_csv_gaze_has_expected_shape_and_columns(kwargs, expected_shape, expected_schema):
@@ -314,3 +368,29 @@ def test_from_csv_gaze_has_expected_shape_and_columns(kwargs, expected_shape, ex
 
     assert gaze_dataframe.frame.shape == expected_shape
     assert gaze_dataframe.frame.schema == expected_schema
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        pytest.param(
+            {
+                'file': 'tests/files/monocular_example.csv',
+                'time_column': 'time',
+                'pixel_columns': ['x_left_pix', 'nope'],
+            },
+            id='missing_pixel_column',
+        ),
+        pytest.param(
+            {
+                'file': 'tests/files/monocular_example.csv',
+                'time_column': 'time',
+                'position_columns': ['x_left_pix', 'nope'],
+            },
+            id='missing_position_column',
+        ),
+    ],
+)
+def test_from_csv_missing_column_raises_column_not_found_error(kwargs):
+    with pytest.raises(pl.exceptions.ColumnNotFoundError, match='nope'):
+        from_csv(**kwargs)
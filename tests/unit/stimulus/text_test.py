@@ -358,3 +358,12 @@ def test_text_stimulus_get_aoi(text_stimulus, row, expected_aoi):
     aoi = text_stimulus.get_aoi(row=row, x_eye='x', y_eye='y')
 
     assert aoi['char'].first() == expected_aoi
+
+
+def test_text_stimulus_get_aois(text_stimulus):
+    frame = polars.DataFrame({'x': [400, 500, None], 'y': [125, 300, 125]})
+
+    aois = text_stimulus.get_aois(frame, x_eye='x', y_eye='y')
+
+    assert aois.columns == text_stimulus.aois.columns
+    assert aois['char'].to_list() == ['A', None, None]